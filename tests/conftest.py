@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from umbral import SecretKey, Signer, generate_kfrags, encrypt
@@ -60,3 +62,9 @@ def capsule_and_ciphertext(alices_keys, message):
 def capsule(capsule_and_ciphertext):
     capsule, ciphertext = capsule_and_ciphertext
     return capsule
+
+
+@pytest.fixture(scope='session')
+def process_pool():
+    with ProcessPoolExecutor() as pool:
+        yield pool
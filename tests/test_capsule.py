@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from umbral import (
@@ -10,7 +12,32 @@ from umbral import (
     decrypt_reencrypted,
     generate_kfrags
     )
+from umbral.capsule import lambda_coeffs, _batch_invert
 from umbral.curve_point import CurvePoint
+from umbral.curve_scalar import CurveScalar
+from umbral.key_frag import poly_eval
+
+
+@pytest.mark.parametrize('threshold', [1, 2, 6])
+def test_lambda_coeffs(threshold):
+    coeffs = [CurveScalar.random_nonzero() for _ in range(threshold)]
+    xs = [CurveScalar.random_nonzero() for _ in range(threshold)]
+    ys = [poly_eval(coeffs, x) for x in xs]
+
+    lambdas = lambda_coeffs(xs)
+
+    # Lagrange interpolation at zero recovers the free coefficient
+    result = CurveScalar.from_int(0)
+    for lambda_i, y in zip(lambdas, ys):
+        result = result + lambda_i * y
+    assert result == coeffs[0]
+
+
+@pytest.mark.parametrize('num_scalars', [1, 2, 6])
+def test_batch_invert(num_scalars):
+    scalars = [CurveScalar.random_nonzero() for _ in range(num_scalars)]
+    inverses = _batch_invert(scalars)
+    assert inverses == [scalar.invert() for scalar in scalars]
 
 
 def test_capsule_serialization(alices_keys):
@@ -23,6 +50,11 @@ def test_capsule_serialization(alices_keys):
 
     assert capsule == new_capsule
 
+    # Any bytes-like object can be deserialized
+    capsule_bytes = bytes(capsule)
+    assert Capsule.from_bytes(bytearray(capsule_bytes)) == capsule
+    assert Capsule.from_bytes(memoryview(capsule_bytes)) == capsule
+
     # Deserializing a bad capsule triggers verification error
     capsule.point_e = CurvePoint.random()
     capsule_bytes = bytes(capsule)
@@ -91,6 +123,12 @@ def test_open_reencrypted(alices_keys, bobs_keys):
     with pytest.raises(ValueError, match="Some of the CapsuleFrags are repeated"):
         capsule.open_reencrypted(receiving_sk, delegating_pk, [cfrags[0]] + cfrags[:threshold-1])
 
+    # Different cfrags created with the same kfrag
+    cfrag0_again = reencrypt(capsule, kfrags[0]).cfrag
+    assert cfrag0_again != cfrags[0]
+    with pytest.raises(ValueError, match="Some of the CapsuleFrags are repeated"):
+        capsule.open_reencrypted(receiving_sk, delegating_pk, [cfrag0_again] + cfrags[:threshold-1])
+
     # Mismatched cfrags
     kfrags2 = generate_kfrags(delegating_sk=delegating_sk,
                               signer=signer,
@@ -102,6 +140,10 @@ def test_open_reencrypted(alices_keys, bobs_keys):
         capsule.open_reencrypted(receiving_sk, delegating_pk, [cfrags2[0]] + cfrags[:threshold-1])
 
 
+def test_capsule_pickling(capsule):
+    assert pickle.loads(pickle.dumps(capsule)) == capsule
+
+
 def test_capsule_str(capsule):
     s = str(capsule)
     assert 'Capsule' in s
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from umbral import encrypt, reencrypt, CapsuleFrag, Capsule, VerificationError
@@ -46,6 +48,35 @@ def test_cfrag_serialization(verification_keys, capsule, kfrags):
                              )
 
 
+def _reencrypt_unverified(capsule, kfrag):
+    # `VerifiedCapsuleFrag` cannot be pickled, so it is verified again in the parent process.
+    return reencrypt(capsule, kfrag).cfrag
+
+
+def test_cfrag_reencryption_in_process_pool(process_pool, verification_keys, capsule, kfrags):
+
+    verifying_pk, delegating_pk, receiving_pk = verification_keys
+
+    cfrags = list(process_pool.map(_reencrypt_unverified, [capsule] * len(kfrags), kfrags))
+
+    for kfrag, cfrag in zip(kfrags, cfrags):
+        verified_cfrag = cfrag.verify(capsule,
+                                      verifying_pk=verifying_pk,
+                                      delegating_pk=delegating_pk,
+                                      receiving_pk=receiving_pk,
+                                      )
+        assert verified_cfrag.cfrag.kfrag_id == kfrag.kfrag.id
+
+
+def test_cfrag_pickling(capsule, kfrags):
+    verified_cfrag = reencrypt(capsule, kfrags[0])
+    cfrag = verified_cfrag.cfrag
+    assert pickle.loads(pickle.dumps(cfrag)) == cfrag
+
+    with pytest.raises(TypeError, match="VerifiedCapsuleFrag objects cannot be pickled"):
+        pickle.dumps(verified_cfrag)
+
+
 def test_cfrag_with_wrong_capsule(verification_keys, kfrags, capsule_and_ciphertext, message):
 
     capsule, ciphertext = capsule_and_ciphertext
@@ -25,6 +25,28 @@ def _create_keypair(umbral):
     return bytes(sk), bytes(pk)
 
 
+@pytest.fixture(scope='session')
+def keypairs_by_backend():
+    # Filled lazily by `keypairs`, so that each backend only generates its keys once per session.
+    return {}
+
+
+@pytest.fixture
+def keypairs(implementations, keypairs_by_backend):
+    """
+    Serialized keypairs created by the source backend (the one acting as client 1).
+    The tests only check round-trips, so it is safe to reuse them.
+    """
+    umbral1, _umbral2 = implementations
+    if umbral1 not in keypairs_by_backend:
+        keypairs_by_backend[umbral1] = dict(
+            delegating=_create_keypair(umbral1),
+            receiving=_create_keypair(umbral1),
+            signing=_create_keypair(umbral1),
+            )
+    return keypairs_by_backend[umbral1]
+
+
 def _restore_keys(umbral, sk_bytes, pk_bytes):
     sk = umbral.SecretKey.from_bytes(sk_bytes)
     pk_from_sk = sk.public_key()
@@ -32,11 +54,11 @@ def _restore_keys(umbral, sk_bytes, pk_bytes):
     assert pk_from_sk == pk_from_bytes
 
 
-def test_keys(implementations):
+def test_keys(implementations, keypairs):
     umbral1, umbral2 = implementations
 
     # On client 1
-    sk_bytes, pk_bytes = _create_keypair(umbral1)
+    sk_bytes, pk_bytes = keypairs['delegating']
 
     # On client 2
     _restore_keys(umbral2, sk_bytes, pk_bytes)
@@ -65,26 +87,26 @@ def test_secret_key_factory(implementations):
 
 def _encrypt(umbral, plaintext, pk_bytes):
     pk = umbral.PublicKey.from_bytes(pk_bytes)
-    capsule, ciphertext = umbral.encrypt(pk, plaintext)
-    return bytes(capsule), ciphertext
+    return umbral.encrypt(pk, plaintext)
 
 
 def _decrypt_original(umbral, sk_bytes, capsule_bytes, ciphertext):
-    capsule = umbral.Capsule.from_bytes(bytes(capsule_bytes))
+    capsule = umbral.Capsule.from_bytes(capsule_bytes)
     sk = umbral.SecretKey.from_bytes(sk_bytes)
     return umbral.decrypt_original(sk, capsule, ciphertext)
 
 
-def test_encrypt_decrypt(implementations):
+def test_encrypt_decrypt(implementations, keypairs):
 
     umbral1, umbral2 = implementations
     plaintext = b'peace at dawn'
 
     # On client 1
-    sk_bytes, pk_bytes = _create_keypair(umbral1)
+    sk_bytes, pk_bytes = keypairs['delegating']
 
     # On client 2
-    capsule_bytes, ciphertext = _encrypt(umbral2, plaintext, pk_bytes)
+    capsule, ciphertext = _encrypt(umbral2, plaintext, pk_bytes)
+    capsule_bytes = bytes(capsule)
 
     # On client 1
     plaintext_decrypted = _decrypt_original(umbral1, sk_bytes, capsule_bytes, ciphertext)
@@ -121,7 +143,7 @@ def _verify_kfrags(umbral, kfrags_bytes, verifying_pk_bytes, delegating_pk_bytes
                          receiving_pk=receiving_pk) for kfrag in kfrags]
 
 
-def test_kfrags(implementations):
+def test_kfrags(implementations, keypairs):
 
     umbral1, umbral2 = implementations
 
@@ -131,9 +153,9 @@ def test_kfrags(implementations):
 
     # On client 1
 
-    receiving_sk_bytes, receiving_pk_bytes = _create_keypair(umbral1)
-    delegating_sk_bytes, delegating_pk_bytes = _create_keypair(umbral1)
-    signing_sk_bytes, verifying_pk_bytes = _create_keypair(umbral1)
+    receiving_sk_bytes, receiving_pk_bytes = keypairs['receiving']
+    delegating_sk_bytes, delegating_pk_bytes = keypairs['delegating']
+    signing_sk_bytes, verifying_pk_bytes = keypairs['signing']
     kfrags_bytes = _generate_kfrags(umbral1, delegating_sk_bytes, receiving_pk_bytes,
                                     signing_sk_bytes, threshold, num_kfrags)
 
@@ -143,8 +165,7 @@ def test_kfrags(implementations):
 
 
 def _reencrypt(umbral, verifying_pk_bytes, delegating_pk_bytes, receiving_pk_bytes,
-               capsule_bytes, kfrags_bytes, threshold):
-    capsule = umbral.Capsule.from_bytes(bytes(capsule_bytes))
+               capsule, kfrags_bytes, threshold):
     verified_kfrags = _verify_kfrags(umbral, kfrags_bytes,
                                      verifying_pk_bytes, delegating_pk_bytes, receiving_pk_bytes)
     cfrags = [umbral.reencrypt(capsule, kfrag) for kfrag in verified_kfrags[:threshold]]
@@ -152,14 +173,13 @@ def _reencrypt(umbral, verifying_pk_bytes, delegating_pk_bytes, receiving_pk_byt
 
 
 def _decrypt_reencrypted(umbral, receiving_sk_bytes, delegating_pk_bytes, verifying_pk_bytes,
-                         capsule_bytes, cfrags_bytes, ciphertext):
+                         capsule, cfrags_bytes, ciphertext):
 
     receiving_sk = umbral.SecretKey.from_bytes(receiving_sk_bytes)
     receiving_pk = receiving_sk.public_key()
     delegating_pk = umbral.PublicKey.from_bytes(delegating_pk_bytes)
     verifying_pk = umbral.PublicKey.from_bytes(verifying_pk_bytes)
 
-    capsule = umbral.Capsule.from_bytes(bytes(capsule_bytes))
     cfrags = [umbral.CapsuleFrag.from_bytes(cfrag_bytes) for cfrag_bytes in cfrags_bytes]
 
     verified_cfrags = [cfrag.verify(capsule,
@@ -180,7 +200,7 @@ def _decrypt_reencrypted(umbral, receiving_sk_bytes, delegating_pk_bytes, verify
     return plaintext
 
 
-def test_reencrypt(implementations):
+def test_reencrypt(implementations, keypairs):
 
     umbral1, umbral2 = implementations
 
@@ -190,25 +210,27 @@ def test_reencrypt(implementations):
 
     # On client 1
 
-    receiving_sk_bytes, receiving_pk_bytes = _create_keypair(umbral1)
-    delegating_sk_bytes, delegating_pk_bytes = _create_keypair(umbral1)
-    signing_sk_bytes, verifying_pk_bytes = _create_keypair(umbral1)
+    receiving_sk_bytes, receiving_pk_bytes = keypairs['receiving']
+    delegating_sk_bytes, delegating_pk_bytes = keypairs['delegating']
+    signing_sk_bytes, verifying_pk_bytes = keypairs['signing']
 
-    capsule_bytes, ciphertext = _encrypt(umbral1, plaintext, delegating_pk_bytes)
+    capsule, ciphertext = _encrypt(umbral1, plaintext, delegating_pk_bytes)
+    capsule_bytes = bytes(capsule)
 
     kfrags_bytes = _generate_kfrags(umbral1, delegating_sk_bytes, receiving_pk_bytes,
                                     signing_sk_bytes, threshold, num_kfrags)
 
     # On client 2
 
+    capsule2 = umbral2.Capsule.from_bytes(capsule_bytes)
     cfrags_bytes = _reencrypt(umbral2, verifying_pk_bytes, delegating_pk_bytes, receiving_pk_bytes,
-                              capsule_bytes, kfrags_bytes, threshold)
+                              capsule2, kfrags_bytes, threshold)
 
     # On client 1
 
     plaintext_reencrypted = _decrypt_reencrypted(umbral1,
                                                  receiving_sk_bytes, delegating_pk_bytes, verifying_pk_bytes,
-                                                 capsule_bytes, cfrags_bytes, ciphertext)
+                                                 capsule, cfrags_bytes, ciphertext)
 
     assert plaintext_reencrypted == plaintext
 
@@ -226,13 +248,13 @@ def _verify_message(umbral, pk_bytes, signature_bytes, message):
     return signature.verify(pk, message)
 
 
-def test_signer(implementations):
+def test_signer(implementations, keypairs):
 
     umbral1, umbral2 = implementations
 
     message = b'peace at dawn'
 
-    sk_bytes, pk_bytes = _create_keypair(umbral1)
+    sk_bytes, pk_bytes = keypairs['signing']
 
     signature1_bytes = _sign_message(umbral1, sk_bytes, message)
     signature2_bytes = _sign_message(umbral2, sk_bytes, message)
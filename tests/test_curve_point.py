@@ -2,6 +2,7 @@ import pytest
 
 from umbral.openssl import ErrorInvalidCompressedPoint, ErrorInvalidPointEncoding
 from umbral.curve_point import CurvePoint
+from umbral.curve_scalar import CurveScalar
 from umbral.curve import CURVE
 
 
@@ -24,6 +25,15 @@ def test_generator_point():
     assert g1 == g2
 
 
+def test_eq():
+    p = CurvePoint.random()
+    assert p == CurvePoint.from_bytes(bytes(p))
+    assert p != CurvePoint.random()
+
+    # Other serializable objects are not points
+    assert p != bytes(p)
+
+
 def test_invalid_serialized_points():
 
     field_order = 2**256 - 0x1000003D1
@@ -53,6 +63,24 @@ def test_invalid_serialized_points():
         CurvePoint.from_bytes(bad_format)
 
 
+def test_serialization_is_cached():
+    p = CurvePoint.random()
+    p_bytes = bytes(p)
+    assert bytes(p) is p_bytes
+
+    # Deserialized points reuse the source bytes,
+    # so check the decoded point itself and not just its encoding.
+    new_p = CurvePoint.from_bytes(p_bytes)
+    assert bytes(new_p) is p_bytes
+    assert new_p.to_affine() == p.to_affine()
+
+
+def test_uncached_serialization():
+    p = CurvePoint.random()
+    assert p._uncached_bytes() == bytes(CurvePoint.from_bytes(p._uncached_bytes()))
+    assert p._serialized is None
+
+
 def test_serialize_point_at_infinity():
 
     p = CurvePoint.random()
@@ -62,6 +90,15 @@ def test_serialize_point_at_infinity():
     assert bytes_point_at_infinity == b'\x00'
 
 
+def test_mul_add_generator():
+    g = CurvePoint.generator()
+    p = CurvePoint.random()
+    s1 = CurveScalar.random_nonzero()
+    s2 = CurveScalar.random_nonzero()
+    assert p.mul_add_generator(s1, s2) == p * s1 + g * s2
+    assert p.mul_add_generator(s1, -s2) == p * s1 - g * s2
+
+
 def test_to_affine():
     p = CurvePoint.generator()
     x_ref = 0x79BE667E_F9DCBBAC_55A06295_CE870B07_029BFCDB_2DCE28D9_59F2815B_16F81798
@@ -56,6 +56,9 @@ def test_eq():
     assert random != different
     assert random != int(different)
 
+    # Other serializable objects are not scalars
+    assert random != bytes(random)
+
 
 def test_serialization_rotations_of_1():
 
@@ -109,6 +112,14 @@ def test_sub():
     assert r1 - r2i == (r1i - r2i) % CURVE.order
 
 
+def test_neg():
+    r1 = CurveScalar.random_nonzero()
+    r1i = int(r1)
+    assert -r1 == (-r1i) % CURVE.order
+    assert r1 + (-r1) == 0
+    assert -CurveScalar.from_int(0) == 0
+
+
 def test_mul():
     r1 = CurveScalar.random_nonzero()
     r2 = CurveScalar.random_nonzero()
@@ -125,3 +136,6 @@ def test_invert():
     assert r1 * r1inv == CurveScalar.one()
     assert (r1i * int(r1inv)) % CURVE.order == 1
 
+    with pytest.raises(ValueError, match="Zero cannot be inverted"):
+        CurveScalar.from_int(0).invert()
+
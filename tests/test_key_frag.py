@@ -1,10 +1,27 @@
+import pickle
+
 import pytest
 
 from umbral import KeyFrag, Signer, VerificationError
-from umbral.key_frag import KeyFragID, KeyFragBase, VerifiedKeyFrag
+from umbral.key_frag import KeyFragID, KeyFragBase, VerifiedKeyFrag, poly_eval
 from umbral.curve_scalar import CurveScalar
 
 
+@pytest.mark.parametrize('degree', [0, 1, 5])
+def test_poly_eval(degree):
+    coeffs = [CurveScalar.random_nonzero() for _ in range(degree + 1)]
+    x = CurveScalar.random_nonzero()
+
+    expected = CurveScalar.from_int(0)
+    for i, coeff in enumerate(coeffs):
+        x_power = CurveScalar.one()
+        for _ in range(i):
+            x_power = x_power * x
+        expected = expected + coeff * x_power
+
+    assert poly_eval(coeffs, x) == expected
+
+
 def test_kfrag_serialization(verification_keys, kfrags):
 
     verifying_pk, delegating_pk, receiving_pk = verification_keys
@@ -117,6 +134,19 @@ def test_kfrag_is_hashable(verification_keys, kfrags):
     assert hash(verified_kfrag) == hash(kfrags[0])
 
 
+def test_kfrag_pickling(kfrags):
+    verified_kfrag = kfrags[0]
+    kfrag = KeyFrag.from_bytes(bytes(verified_kfrag))
+
+    new_verified_kfrag = pickle.loads(pickle.dumps(verified_kfrag))
+    assert isinstance(new_verified_kfrag, VerifiedKeyFrag)
+    assert new_verified_kfrag == verified_kfrag
+
+    new_kfrag = pickle.loads(pickle.dumps(kfrag))
+    assert isinstance(new_kfrag, KeyFrag)
+    assert new_kfrag == kfrag
+
+
 def test_kfrag_str(kfrags):
     s = str(kfrags[0])
     assert "VerifiedKeyFrag" in s
@@ -1,4 +1,5 @@
 import os
+import pickle
 import string
 
 import pytest
@@ -66,6 +67,12 @@ def test_secret_key_hash():
         hash(sk)
 
 
+def test_secret_key_pickling():
+    sk = SecretKey.random()
+    with pytest.raises(TypeError, match="Pickling secret objects is not secure"):
+        pickle.dumps(sk)
+
+
 def test_secret_key_factory_str():
     skf = SecretKeyFactory.random()
     s = str(skf)
@@ -79,6 +86,12 @@ def test_secret_key_factory_hash():
         hash(skf)
 
 
+def test_secret_key_factory_pickling():
+    skf = SecretKeyFactory.random()
+    with pytest.raises(TypeError, match="Pickling secret objects is not secure"):
+        pickle.dumps(skf)
+
+
 def test_public_key_serialization():
     sk = SecretKey.random()
     pk = sk.public_key()
@@ -1,3 +1,4 @@
+import pickle
 import re
 
 import pytest
@@ -77,6 +78,11 @@ def test_normal_operation():
     assert c_back == c
 
 
+def test_pickling():
+    c = C(A(2**32 - 123), B(2**16 - 456))
+    assert pickle.loads(pickle.dumps(c)) == c
+
+
 def test_too_many_bytes():
     a = A(2**32 - 123)
     b = B(2**16 - 456)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from umbral.keys import PublicKey, SecretKey
@@ -5,10 +7,17 @@ from umbral.signing import Signature, Signer
 from umbral.hashing import Hash
 
 
-@pytest.mark.parametrize('execution_number', range(20))  # Run this test 20 times.
-def test_sign_and_verify(execution_number):
+@pytest.fixture(scope='module')
+def keypair():
+    # The repeated tests below exercise the randomness of signing, not of key generation.
     sk = SecretKey.random()
     pk = sk.public_key()
+    return sk, pk
+
+
+@pytest.mark.parametrize('execution_number', range(20))  # Run this test 20 times.
+def test_sign_and_verify(keypair, execution_number):
+    sk, pk = keypair
     signer = Signer(sk)
 
     message = b"peace at dawn" + str(execution_number).encode()
@@ -18,9 +27,8 @@ def test_sign_and_verify(execution_number):
 
 
 @pytest.mark.parametrize('execution_number', range(20))  # Run this test 20 times.
-def test_sign_serialize_and_verify(execution_number):
-    sk = SecretKey.random()
-    pk = sk.public_key()
+def test_sign_serialize_and_verify(keypair, execution_number):
+    sk, pk = keypair
     signer = Signer(sk)
 
     message = b"peace at dawn" + str(execution_number).encode()
@@ -104,6 +112,12 @@ def test_signer_bytes():
         bytes(signer)
 
 
+def test_signer_pickling():
+    signer = Signer(SecretKey.random())
+    with pytest.raises(TypeError, match="Signer objects do not support pickling"):
+        pickle.dumps(signer)
+
+
 def test_signer_pubkey():
     sk = SecretKey.random()
     pk = sk.public_key()
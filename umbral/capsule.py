@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Tuple, Sequence
+from typing import TYPE_CHECKING, Tuple, Sequence, List
 
 from .curve_point import CurvePoint
 from .curve_scalar import CurveScalar
@@ -9,13 +9,48 @@ if TYPE_CHECKING: # pragma: no cover
     from .capsule_frag import CapsuleFrag
 
 
-def lambda_coeff(xs: Sequence[CurveScalar], i: int) -> CurveScalar:
-    res = CurveScalar.one()
-    for j, xs_j in enumerate(xs):
-        if j != i:
-            inv_diff = (xs_j - xs[i]).invert()
-            res = (res * xs_j) * inv_diff
-    return res
+def lambda_coeffs(xs: Sequence[CurveScalar]) -> List[CurveScalar]:
+    """
+    Returns the Lagrange coefficients at zero for every point in ``xs``,
+    that is, ``prod(xs[j] / (xs[j] - xs[i]) for j != i)`` for every ``i``.
+    """
+    # The numerators `prod(xs[j] for j != i)` are assembled from prefix and suffix products.
+    prefixes = [CurveScalar.one()]
+    for x in xs[:-1]:
+        prefixes.append(prefixes[-1] * x)
+    suffixes = [CurveScalar.one()]
+    for x in reversed(xs[1:]):
+        suffixes.append(suffixes[-1] * x)
+    suffixes.reverse()
+
+    denominators = []
+    for i, xs_i in enumerate(xs):
+        denominator = CurveScalar.one()
+        for j, xs_j in enumerate(xs):
+            if j != i:
+                denominator = denominator * (xs_j - xs_i)
+        denominators.append(denominator)
+
+    inv_denominators = _batch_invert(denominators)
+    return [(prefixes[i] * suffixes[i]) * inv_denominators[i] for i in range(len(xs))]
+
+
+def _batch_invert(scalars: Sequence[CurveScalar]) -> List[CurveScalar]:
+    """
+    Inverts all the given (nonzero) scalars with a single inversion (Montgomery's trick).
+    """
+    # partials[i] = scalars[0] * ... * scalars[i-1]
+    partials = [CurveScalar.one()]
+    for scalar in scalars:
+        partials.append(partials[-1] * scalar)
+
+    # Going backwards, `inv` is the inverse of `scalars[0] * ... * scalars[i]`.
+    inv = partials[-1].invert()
+    inverses = [inv] * len(scalars)
+    for i in reversed(range(len(scalars))):
+        inverses[i] = inv * partials[i]
+        inv = inv * scalars[i]
+    return inverses
 
 
 class Capsule(Serializable, Deserializable):
@@ -76,7 +111,10 @@ class Capsule(Serializable, Deserializable):
 
         precursor = cfrags[0].precursor
 
-        if len(set(cfrags)) != len(cfrags):
+        # Comparing IDs instead of whole cfrags: this avoids serializing every cfrag,
+        # and also catches distinct cfrags made with the same kfrag,
+        # which would make the Lagrange coefficients undefined.
+        if len(set(bytes(cfrag.kfrag_id) for cfrag in cfrags)) != len(cfrags):
             raise ValueError("Some of the CapsuleFrags are repeated")
 
         if not all(cfrag.precursor == precursor for cfrag in cfrags[1:]):
@@ -91,8 +129,7 @@ class Capsule(Serializable, Deserializable):
 
         e_primes = []
         v_primes = []
-        for i, cfrag in enumerate(cfrags):
-            lambda_i = lambda_coeff(lc, i)
+        for lambda_i, cfrag in zip(lambda_coeffs(lc), cfrags):
             e_primes.append(cfrag.point_e1 * lambda_i)
             v_primes.append(cfrag.point_v1 * lambda_i)
         e_prime = sum(e_primes[1:], e_primes[0])
@@ -117,10 +154,11 @@ class Capsule(Serializable, Deserializable):
         return (self.point_e, self.point_v, self.signature)
 
     def _verify(self) -> bool:
-        g = CurvePoint.generator()
         e, v, s = self._components()
         h = hash_capsule_points(e, v)
-        return g * s == v + (e * h)
+        # Checking `g * s == v + e * h`.
+        # All the scalars are public, so we can use the faster variable-time multiplication.
+        return e.mul_add_generator(-h, s) == v
 
     def __eq__(self, other):
         return self._components() == other._components()
@@ -238,5 +238,11 @@ class VerifiedCapsuleFrag(Serializable):
     def __hash__(self):
         return hash((self.__class__, bytes(self)))
 
+    def __reduce__(self):
+        # Unlike `VerifiedKeyFrag`, there is no trusted constructor from bytes,
+        # so unpickling would bypass the verification.
+        raise TypeError(f"{self.__class__.__name__} objects cannot be pickled; "
+                        "pickle the `cfrag` attribute and verify it after unpickling")
+
     def __str__(self):
         return f"{self.__class__.__name__}:{bytes(self).hex()[:16]}"
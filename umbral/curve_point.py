@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from . import openssl
 from .curve import CURVE
@@ -13,6 +13,11 @@ class CurvePoint(Serializable, Deserializable):
 
     def __init__(self, backend_point) -> None:
         self._backend_point = backend_point
+        # The serialized form of public points is cached, since they are hashed and serialized
+        # over and over (EC_POINTs are never modified in place, so it stays valid).
+        # Secret points (DEM key seeds, DH points) must be serialized with `_uncached_bytes()`,
+        # so that their encoding does not live in an unwipeable `bytes` for the object's lifetime.
+        self._serialized: Optional[bytes] = None
 
     @classmethod
     def generator(cls) -> 'CurvePoint':
@@ -42,18 +47,32 @@ class CurvePoint(Serializable, Deserializable):
         """
         Returns a CurvePoint object from the given byte data on the curve provided.
         """
-        return cls(openssl.point_from_bytes(CURVE, data))
+        point = cls(openssl.point_from_bytes(CURVE, data))
+        # A point of this size can only be decoded from its canonical compressed form
+        # (the coordinate is checked to be under the field modulus), so it can be reused.
+        point._serialized = bytes(data)
+        return point
 
     def __bytes__(self) -> bytes:
         """
         Returns the CurvePoint serialized as bytes in the compressed form.
         """
+        if self._serialized is None:
+            self._serialized = self._uncached_bytes()
+        return self._serialized
+
+    def _uncached_bytes(self) -> bytes:
+        """
+        Same as ``bytes()``, but does not keep the result. Used for secret points.
+        """
         return openssl.point_to_bytes_compressed(CURVE, self._backend_point)
 
     def __eq__(self, other):
         """
         Compares two EC_POINTS for equality.
         """
+        if not isinstance(other, CurvePoint):
+            return NotImplemented
         return openssl.point_eq(CURVE, self._backend_point, other._backend_point)
 
     def __mul__(self, other: CurveScalar) -> 'CurvePoint':
@@ -62,6 +81,16 @@ class CurvePoint(Serializable, Deserializable):
         """
         return CurvePoint(openssl.point_mul_bn(CURVE, self._backend_point, other._backend_bignum))
 
+    def mul_add_generator(self, scalar: CurveScalar, generator_scalar: CurveScalar) -> 'CurvePoint':
+        """
+        Returns ``self * scalar + generator * generator_scalar``,
+        at roughly the cost of a single multiplication.
+
+        WARNING: not in constant time, use only when both scalars are public.
+        """
+        return CurvePoint(openssl.point_mul_bn_add_generator_mul_bn(
+            CURVE, self._backend_point, scalar._backend_bignum, generator_scalar._backend_bignum))
+
     def __add__(self, other: 'CurvePoint') -> 'CurvePoint':
         """
         Performs an EC_POINT_add on two EC_POINTS.
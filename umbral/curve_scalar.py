@@ -1,3 +1,4 @@
+import hmac
 from typing import TYPE_CHECKING, Union, Tuple
 
 from . import openssl
@@ -67,10 +68,16 @@ class CurveScalar(Serializable, Deserializable):
     def __eq__(self, other) -> bool:
         """
         Compares the two BIGNUMS or int.
+
+        The serialized forms are compared in constant time, since ``BN_cmp()`` exits
+        at the first differing word. The serialization itself (``BN_bn2bin()``)
+        still depends on the number of leading zero bytes of the scalars.
         """
         if isinstance(other, int):
             other = CurveScalar.from_int(other)
-        return openssl.bn_cmp(self._backend_bignum, other._backend_bignum) == 0
+        if not isinstance(other, CurveScalar):
+            return NotImplemented
+        return hmac.compare_digest(bytes(self), bytes(other))
 
     @classmethod
     def one(cls):
@@ -109,9 +116,17 @@ class CurveScalar(Serializable, Deserializable):
                                           other._backend_bignum,
                                           CURVE.bn_order))
 
+    def __neg__(self) -> 'CurveScalar':
+        """
+        Performs a BN_mod_sub of the BIGNUM from zero.
+        """
+        return CurveScalar(openssl.bn_sub(openssl.bn_from_int(0),
+                                          self._backend_bignum,
+                                          CURVE.bn_order))
+
     def invert(self) -> 'CurveScalar':
         """
-        Performs a BN_mod_inverse.
-        WARNING: Only in constant time if BN_FLG_CONSTTIME is set on the BN.
+        Performs a modular inversion in constant time.
+        Raises ``ValueError`` if the scalar is zero.
         """
-        return CurveScalar(openssl.bn_invert(self._backend_bignum, CURVE.bn_order))
+        return CurveScalar(openssl.bn_invert_mod_order(CURVE, self._backend_bignum))
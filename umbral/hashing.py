@@ -13,21 +13,65 @@ if TYPE_CHECKING: # pragma: no cover
     from .keys import PublicKey
 
 
+def _hash_with_dst(dst: bytes) -> hashes.Hash:
+    """
+    Returns a new backend hash with the given DST already absorbed.
+    """
+    backend_hash = hashes.Hash(hashes.SHA256(), backend=backend)
+    len_dst = len(dst).to_bytes(4, byteorder='big')
+    backend_hash.update(len_dst + dst)
+    return backend_hash
+
+
+_POLYNOMIAL_ARG_DST = b"POLYNOMIAL_ARG"
+_CAPSULE_POINTS_DST = b"CAPSULE_POINTS"
+_SHARED_SECRET_DST = b"SHARED_SECRET"
+_CFRAG_VERIFICATION_DST = b"CFRAG_VERIFICATION"
+
+# States with the DSTs of the hashing functions below absorbed, copied by `Hash`.
+# Only for these fixed DSTs: an arbitrary DST (e.g. a key derivation label) is hashed afresh.
+# These objects are shared, so they must never be updated or finalized.
+_FIXED_DST_HASHES = {dst: _hash_with_dst(dst)
+                     for dst in (_POLYNOMIAL_ARG_DST,
+                                 _CAPSULE_POINTS_DST,
+                                 _SHARED_SECRET_DST,
+                                 _CFRAG_VERIFICATION_DST)}
+
+
 class Hash:
 
     OUTPUT_SIZE = 32
 
     def __init__(self, dst: Optional[bytes] = None):
         self._backend_hash_algorithm = hashes.SHA256()
-        self._hash = hashes.Hash(self._backend_hash_algorithm, backend=backend)
-
-        if dst is not None:
-            len_dst = len(dst).to_bytes(4, byteorder='big')
-            self.update(len_dst + dst)
+        if dst is None:
+            self._hash = hashes.Hash(self._backend_hash_algorithm, backend=backend)
+        elif dst in _FIXED_DST_HASHES:
+            # Copying the state is cheaper than hashing the DST again.
+            self._hash = _FIXED_DST_HASHES[dst].copy()
+        else:
+            self._hash = _hash_with_dst(dst)
 
     def update(self, data: Union[bytes, Serializable]) -> None:
         self._hash.update(bytes(data))
 
+    def update_many(self, items: Iterable[Union[bytes, Serializable]]) -> None:
+        """
+        Equivalent to calling ``update()`` on every item,
+        but concatenates them first and feeds them to the backend at once.
+        """
+        self._hash.update(b''.join(bytes(item) for item in items))
+
+    def copy(self) -> 'Hash':
+        """
+        Returns an independent copy of the hash in its current state.
+        Can be used to reuse an already absorbed prefix, since ``finalize()`` consumes the hash.
+        """
+        copied = Hash.__new__(Hash)
+        copied._backend_hash_algorithm = self._backend_hash_algorithm
+        copied._hash = self._hash.copy()
+        return copied
+
     def finalize(self) -> bytes:
         return self._hash.finalize()
 
@@ -37,18 +81,14 @@ def hash_to_polynomial_arg(precursor: CurvePoint,
                            dh_point: CurvePoint,
                            kfrag_id: 'KeyFragID',
                            ) -> CurveScalar:
-    digest = Hash(b"POLYNOMIAL_ARG")
-    digest.update(precursor)
-    digest.update(pubkey)
-    digest.update(dh_point)
-    digest.update(kfrag_id)
+    digest = Hash(_POLYNOMIAL_ARG_DST)
+    digest.update_many([precursor, pubkey, dh_point._uncached_bytes(), kfrag_id])
     return CurveScalar.from_digest(digest)
 
 
 def hash_capsule_points(e: CurvePoint, v: CurvePoint) -> CurveScalar:
-    digest = Hash(b"CAPSULE_POINTS")
-    digest.update(e)
-    digest.update(v)
+    digest = Hash(_CAPSULE_POINTS_DST)
+    digest.update_many([e, v])
     return CurveScalar.from_digest(digest)
 
 
@@ -56,17 +96,14 @@ def hash_to_shared_secret(precursor: CurvePoint,
                           pubkey: CurvePoint,
                           dh_point: CurvePoint
                           ) -> CurveScalar:
-    digest = Hash(b"SHARED_SECRET")
-    digest.update(precursor)
-    digest.update(pubkey)
-    digest.update(dh_point)
+    digest = Hash(_SHARED_SECRET_DST)
+    digest.update_many([precursor, pubkey, dh_point._uncached_bytes()])
     return CurveScalar.from_digest(digest)
 
 
 def hash_to_cfrag_verification(points: Iterable[CurvePoint]) -> CurveScalar:
-    digest = Hash(b"CFRAG_VERIFICATION")
-    for point in points:
-        digest.update(point)
+    digest = Hash(_CFRAG_VERIFICATION_DST)
+    digest.update_many(points)
     return CurveScalar.from_digest(digest)
 
 
@@ -105,14 +142,15 @@ def unsafe_hash_to_point(dst: bytes, data: bytes) -> CurvePoint:
     """
 
     len_data = len(data).to_bytes(4, byteorder='big')
-    data_with_len = len_data + data
+    prefix = Hash(dst)
+    prefix.update(len_data + data)
     sign = b'\x02'
 
     # We use an internal 32-bit counter as additional input
     for i in range(2**32):
         ibytes = i.to_bytes(4, byteorder='big')
-        digest = Hash(dst)
-        digest.update(data_with_len + ibytes)
+        digest = prefix.copy()
+        digest.update(ibytes)
         point_data = digest.finalize()[:CURVE.field_element_size]
 
         compressed_point = sign + point_data
@@ -1,6 +1,8 @@
 import os
 from typing import List, Optional, Tuple, Type
 
+from . import openssl
+from .curve import CURVE
 from .curve_point import CurvePoint
 from .curve_scalar import CurveScalar
 from .errors import VerificationError
@@ -131,10 +133,11 @@ class KeyFragProof(Serializable, Deserializable):
 
 # Coefficients of the generating polynomial
 def poly_eval(coeffs: List[CurveScalar], x: CurveScalar) -> CurveScalar:
-    result = coeffs[-1]
-    for coeff in reversed(coeffs[:-1]):
-        result = (result * x) + coeff
-    return result
+    # Evaluated in one go on the backend side;
+    # going through `CurveScalar` arithmetic would allocate a new BN_CTX for every operation.
+    return CurveScalar(openssl.bn_poly_eval([coeff._backend_bignum for coeff in coeffs],
+                                            x._backend_bignum,
+                                            CURVE.bn_order))
 
 
 class KeyFrag(Serializable, Deserializable):
@@ -289,6 +292,10 @@ class VerifiedKeyFrag(Serializable):
     def __hash__(self):
         return hash((self.__class__, bytes(self)))
 
+    def __reduce__(self):
+        # Unpickling is trusted in the same way as `from_verified_bytes()`.
+        return (self.__class__.from_verified_bytes, (bytes(self),))
+
     def __str__(self):
         return f"{self.__class__.__name__}:{bytes(self).hex()[:16]}"
 
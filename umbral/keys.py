@@ -42,6 +42,9 @@ class SecretKey(Serializable, Deserializable):
     def __hash__(self):
         raise RuntimeError("Hashing secret objects is not secure")
 
+    def __reduce__(self):
+        raise TypeError("Pickling secret objects is not secure")
+
     def secret_scalar(self) -> CurveScalar:
         return self._scalar_key
 
@@ -141,3 +144,6 @@ class SecretKeyFactory(Serializable, Deserializable):
 
     def __hash__(self):
         raise RuntimeError("Hashing secret objects is not secure")
+
+    def __reduce__(self):
+        raise TypeError("Pickling secret objects is not secure")
@@ -60,6 +60,19 @@ class Curve:
 
         return generator
 
+    @staticmethod
+    def _get_mont_ctx(modulus):
+        """
+        Returns the Montgomery multiplication context for the given modulus.
+        """
+        mont_ctx = BACKEND_LIB.BN_MONT_CTX_new()
+        backend.openssl_assert(mont_ctx != BACKEND_FFI.NULL)
+        mont_ctx = BACKEND_FFI.gc(mont_ctx, BACKEND_LIB.BN_MONT_CTX_free)
+        with tmp_bn_ctx() as bn_ctx:
+            res = BACKEND_LIB.BN_MONT_CTX_set(mont_ctx, modulus, bn_ctx)
+            backend.openssl_assert(res == 1)
+        return mont_ctx
+
     @staticmethod
     def _get_ec_group_degree(ec_group):
         """
@@ -92,6 +105,10 @@ class Curve:
         self.scalar_size = _bn_size(self.bn_order)
         self.order = bn_to_int(self.bn_order)
 
+        # Used for inversions modulo the order, see `bn_invert_mod_order()`.
+        self.bn_order_minus_2 = bn_from_int(self.order - 2)
+        self.bn_order_mont_ctx = self._get_mont_ctx(self.bn_order)
+
     @classmethod
     def from_name(cls, name: str) -> 'Curve':
         """
@@ -204,29 +221,21 @@ def bn_to_bytes(bn, length: int):
 
 def bn_random_nonzero(modulus):
 
-    one = BACKEND_LIB.BN_value_one()
-
     # TODO: in most cases, we want this number to be secret.
     # OpenSSL 1.1.1 has `BN_priv_rand_range()`, but it is not
     # currently exported by `cryptography`.
     # Use when available.
 
-    # Calculate `modulus - 1`
-    modulus_minus_1 = _bn_new()
-    res = BACKEND_LIB.BN_sub(modulus_minus_1, modulus, one)
-    backend.openssl_assert(res == 1)
-
-    # Get a random in range `[0, modulus - 1)`
+    # Get a random in range `[0, modulus)` and reject zero,
+    # which results in a uniform random in range `[1, modulus)`.
+    # For a cryptographically sized modulus a retry practically never happens,
+    # so this is cheaper than shifting a random from `[0, modulus - 1)`.
     new_rand_bn = _bn_new()
-    res = BACKEND_LIB.BN_rand_range(new_rand_bn, modulus_minus_1)
-    backend.openssl_assert(res == 1)
-
-    # Turn it into a random in range `[1, modulus)`
-    op_sum = _bn_new()
-    res = BACKEND_LIB.BN_add(op_sum, new_rand_bn, one)
-    backend.openssl_assert(res == 1)
-
-    return op_sum
+    while True:
+        res = BACKEND_LIB.BN_rand_range(new_rand_bn, modulus)
+        backend.openssl_assert(res == 1)
+        if _bn_size(new_rand_bn) != 0:
+            return new_rand_bn
 
 
 def _bn_size(bn):
@@ -251,11 +260,23 @@ def bn_is_zero(bn):
     return bn_cmp(bn, bn_from_int(0)) == 0
 
 
-def bn_invert(bn, modulus):
+def bn_invert_mod_order(curve: Curve, bn):
+    """
+    Inverts a BIGNUM modulo the (prime) order of the curve as ``bn^(order - 2)``.
+    The constant-time modular exponentiation is faster than ``BN_mod_inverse()``,
+    and, unlike it, does not branch on the value of ``bn``.
+    """
+    inv = _bn_new()
     with tmp_bn_ctx() as bn_ctx:
-        inv = BACKEND_LIB.BN_mod_inverse(BACKEND_FFI.NULL, bn, modulus, bn_ctx)
-        backend.openssl_assert(inv != BACKEND_FFI.NULL)
-        inv = BACKEND_FFI.gc(inv, BACKEND_LIB.BN_clear_free)
+        res = BACKEND_LIB.BN_mod_exp_mont_consttime(inv, bn,
+                                                    curve.bn_order_minus_2, curve.bn_order,
+                                                    bn_ctx, curve.bn_order_mont_ctx)
+        backend.openssl_assert(res == 1)
+
+    # Zero is the only element mapped to zero
+    if _bn_size(inv) == 0:
+        raise ValueError("Zero cannot be inverted")
+
     return inv
 
 
@@ -283,6 +304,25 @@ def bn_mul(bn1, bn2, modulus):
     return product
 
 
+def bn_poly_eval(coeffs, x, modulus):
+    """
+    Evaluates the polynomial with the given coefficients (lowest degree first) at ``x``
+    using Horner's scheme, with a single BN_CTX and a single result BIGNUM for all the steps.
+    """
+    result = BACKEND_LIB.BN_dup(coeffs[-1])
+    backend.openssl_assert(result != BACKEND_FFI.NULL)
+    result = BACKEND_FFI.gc(result, BACKEND_LIB.BN_clear_free)
+    BACKEND_LIB.BN_set_flags(result, BACKEND_LIB.BN_FLG_CONSTTIME)
+
+    with tmp_bn_ctx() as bn_ctx:
+        for coeff in reversed(coeffs[:-1]):
+            res = BACKEND_LIB.BN_mod_mul(result, result, x, modulus, bn_ctx)
+            backend.openssl_assert(res == 1)
+            res = BACKEND_LIB.BN_mod_add(result, result, coeff, modulus, bn_ctx)
+            backend.openssl_assert(res == 1)
+    return result
+
+
 def bn_to_privkey(curve: Curve, bn):
 
     ec_key = BACKEND_LIB.EC_KEY_new()
@@ -398,6 +438,21 @@ def point_mul_bn(curve: Curve, point, bn):
     return prod
 
 
+def point_mul_bn_add_generator_mul_bn(curve: Curve, point, bn, generator_bn):
+    """
+    Calculates ``point * bn + generator * generator_bn`` with a single EC_POINT_mul,
+    which processes both terms simultaneously, sharing the point doublings.
+
+    WARNING: unlike the single-term multiplication, this is not performed in constant time,
+    so it must only be used with public scalars.
+    """
+    prod = _point_new(curve.ec_group)
+    with tmp_bn_ctx() as bn_ctx:
+        res = BACKEND_LIB.EC_POINT_mul(curve.ec_group, prod, generator_bn, point, bn, bn_ctx)
+        backend.openssl_assert(res == 1)
+    return prod
+
+
 def point_add(curve: Curve, point1, point2):
     op_sum = _point_new(curve.ec_group)
     with tmp_bn_ctx() as bn_ctx:
@@ -15,7 +15,7 @@ def encrypt(delegating_pk: PublicKey, plaintext: bytes) -> Tuple[Capsule, bytes]
     Returns the KEM Capsule and the ciphertext.
     """
     capsule, key_seed = Capsule.from_public_key(delegating_pk)
-    dem = DEM(bytes(key_seed))
+    dem = DEM(key_seed._uncached_bytes())
     ciphertext = dem.encrypt(plaintext, authenticated_data=bytes(capsule))
     return capsule, ciphertext
 
@@ -27,7 +27,7 @@ def decrypt_original(delegating_sk: SecretKey, capsule: Capsule, ciphertext: byt
     and return the resulting cleartext.
     """
     key_seed = capsule.open_original(delegating_sk)
-    dem = DEM(bytes(key_seed))
+    dem = DEM(key_seed._uncached_bytes())
     return dem.decrypt(ciphertext, authenticated_data=bytes(capsule))
 
 
@@ -90,5 +90,5 @@ def decrypt_reencrypted(receiving_sk: SecretKey,
 
     cfrags = [vcfrag.cfrag for vcfrag in verified_cfrags]
     key_seed = capsule.open_reencrypted(receiving_sk, delegating_pk, cfrags)
-    dem = DEM(bytes(key_seed))
+    dem = DEM(key_seed._uncached_bytes())
     return dem.decrypt(ciphertext, authenticated_data=bytes(capsule))
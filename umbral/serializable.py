@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABC
-from typing import Tuple, Type, List, Any, TypeVar
+import functools
+from typing import Callable, Tuple, Type, List, Any, TypeVar
 
 
 class HasSerializedSize(ABC):
@@ -27,13 +28,24 @@ class Deserializable(HasSerializedSize):
     @classmethod
     def from_bytes(cls: Type[Self], data: bytes) -> Self:
         """
-        Restores the object from serialized bytes.
+        Restores the object from serialized bytes
+        (or any other object supporting the buffer protocol).
         """
+        # The backend only accepts `bytes`, so the data is converted once here
+        # instead of in every component deserializer.
+        if not isinstance(data, bytes):
+            data = memoryview(data).tobytes()
         expected_size = cls.serialized_size()
         if len(data) != expected_size:
             raise ValueError(f"Expected {expected_size} bytes, got {len(data)}")
         return cls._from_exact_bytes(data)
 
+    def __reduce__(self):
+        """
+        Pickles the object via its serialized form, since the backend objects cannot be pickled.
+        """
+        return (type(self).from_bytes, (bytes(self),))
+
     @staticmethod
     def _split(data: bytes, *types: Type) -> List[Any]:
         """
@@ -43,21 +55,8 @@ class Deserializable(HasSerializedSize):
         objs = []
         pos = 0
 
-        for tp in types:
-
-            if issubclass(tp, bool):
-                size = bool_serialized_size()
-            else:
-                size = tp.serialized_size()
-
-            chunk = data[pos:pos+size]
-
-            if issubclass(tp, bool):
-                obj = bool_from_exact_bytes(chunk)
-            else:
-                obj = tp._from_exact_bytes(chunk)
-
-            objs.append(obj)
+        for size, from_exact_bytes in _layout(types):
+            objs.append(from_exact_bytes(data[pos:pos+size]))
             pos += size
 
         return objs
@@ -72,6 +71,22 @@ class Deserializable(HasSerializedSize):
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=None)
+def _layout(types: Tuple[Type, ...]) -> Tuple[Tuple[int, Callable[[bytes], Any]], ...]:
+    """
+    Returns the serialized sizes and the exact-bytes deserializers for the given types.
+    Resolved once per sequence of types, since the same composite layouts
+    are deserialized over and over.
+    """
+    layout = []
+    for tp in types:
+        if issubclass(tp, bool):
+            layout.append((bool_serialized_size(), bool_from_exact_bytes))
+        else:
+            layout.append((tp.serialized_size(), tp._from_exact_bytes))
+    return tuple(layout)
+
+
 class Serializable(HasSerializedSize):
     """
     A mixin for composable serialization.
@@ -65,6 +65,9 @@ class Signer:
     def __bytes__(self):
         raise RuntimeError(f"{self.__class__.__name__} objects do not support serialization")
 
+    def __reduce__(self):
+        raise TypeError(f"{self.__class__.__name__} objects do not support pickling")
+
 
 class Signature(Serializable, Deserializable):
     """